@@ -0,0 +1,75 @@
+"""
+Build script for the optional native ECG filter kernels
+Run: python build_ecg_kernels.py
+
+1. Compiles src/ecg/native/biquad_sos_8ch_avx2.c into a shared library next
+   to the source file (8-lead AVX2 kernel, loaded with ctypes).
+2. Compiles the Numba filter kernels in src/ecg/filter_kernels.py ahead of
+   time into the src/ecg/ecg_kernels extension module, so the app and
+   short-lived tools skip JIT warm-up on the first filter call.
+
+ecg_filters.py uses whichever of these is present and falls back to
+Numba JIT/SciPy otherwise, so this step is optional.
+"""
+
+import os
+import subprocess
+import sys
+
+# Get the project root directory
+project_root = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(project_root, 'src')
+ecg_dir = os.path.join(src_dir, 'ecg')
+native_dir = os.path.join(ecg_dir, 'native')
+
+source = os.path.join(native_dir, 'biquad_sos_8ch_avx2.c')
+library = os.path.join(native_dir, 'biquad_sos_8ch_avx2' + ('.dll' if sys.platform == 'win32' else '.so'))
+
+
+def build_avx2_kernel():
+    """Compile the AVX2 biquad kernel with the platform C compiler."""
+    if sys.platform == 'win32':
+        # MSVC (run from a "Developer Command Prompt")
+        command = ['cl', '/O2', '/LD', source, f'/Fe:{library}', f'/Fo:{native_dir}\\']
+    else:
+        command = [os.environ.get('CC', 'cc'), '-O3', '-shared', '-fPIC', '-o', library, source]
+    
+    print(f"Source: {source}")
+    print(' '.join(command))
+    subprocess.run(command, check=True)
+    print(f"Built: {library}")
+
+
+def build_aot_kernels():
+    """Compile the Numba SOS kernels ahead of time with numba.pycc."""
+    from numba.pycc import CC
+    
+    sys.path.insert(0, src_dir)
+    from ecg import filter_kernels
+    
+    cc = CC('ecg_kernels')
+    cc.output_dir = ecg_dir
+    for suffix, t in (('f4', 'f4'), ('f8', 'f8')):
+        cc.export(f'sos_filter_{suffix}', f'void({t}[:, :], {t}[:, :], {t}[:, :, :])')(filter_kernels.sos_filter_nb.py_func)
+        cc.export(f'sos_filtfilt_{suffix}', f'{t}[:, :]({t}[:, :], {t}[:, :], {t}[:, :])')(filter_kernels.sos_filtfilt_nb.py_func)
+    
+    print(f"Output directory: {ecg_dir}")
+    cc.compile()
+    print("Built: ecg_kernels extension module")
+
+
+print("Building native ECG filter kernels...")
+
+failed = False
+for step in (build_avx2_kernel, build_aot_kernels):
+    try:
+        step()
+    except Exception as e:
+        print(f"\n{step.__name__} failed: {e}")
+        failed = True
+
+if failed:
+    print("ecg_filters will fall back to the Numba JIT/SciPy filter kernels where needed.")
+    sys.exit(1)
+
+print("\nBuild complete!")
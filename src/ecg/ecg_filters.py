@@ -25,13 +25,442 @@ Usage:
         emg_filter="150",  # "25", "35", "45", "75", "100", "150"
         dft_filter="0.5"  # "off", "0.05", or "0.5"
     )
+    
+    # Real-time streaming: causal filtering with state carried between chunks
+    chain = ECGFilterChain(sampling_rate=500, ac_filter="50", emg_filter="150", dft_filter="0.5")
+    filtered_chunk = chain.process(chunk)
 """
 
+import ctypes
+import functools
+import os
+import sys
+import threading
 import numpy as np
-from scipy.signal import butter, filtfilt, iirnotch, medfilt, find_peaks
-from scipy.ndimage import uniform_filter1d
 from typing import Union, Optional, Tuple
 
+# AC/EMG/DFT filter chain works on float32 buffers: ADC precision is ~12-bit,
+# so float32 loses nothing clinically and halves the memory moved per pass
+# (including the padded forward/backward copies made by zero-phase filtering).
+FILTER_DTYPE = np.float32
+
+# Lead count handled by the optional AVX2 kernel (one lead per vector lane)
+AVX2_CHANNELS = 8
+
+
+def _load_avx2_kernel():
+    """
+    Load the optional AVX2 8-lead biquad kernel (src/ecg/native, built with
+    build_ecg_kernels.py). Returns None if it is not built or the CPU lacks
+    AVX2/FMA, in which case the compiled (AOT/Numba) or SciPy paths are used.
+    """
+    lib_name = "biquad_sos_8ch_avx2" + (".dll" if sys.platform == "win32" else ".so")
+    lib_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "native", lib_name)
+    if not os.path.exists(lib_path):
+        return None
+    
+    try:
+        lib = ctypes.CDLL(lib_path)
+        if not lib.biquad_cpu_has_avx2():
+            return None
+        
+        for func, dtype in ((lib.biquad_sos_8ch_f32, np.float32), (lib.biquad_sos_8ch_f64, np.float64)):
+            func.argtypes = [
+                np.ctypeslib.ndpointer(dtype=dtype, ndim=2, flags="C_CONTIGUOUS"),
+                ctypes.c_int,
+                np.ctypeslib.ndpointer(dtype=dtype, ndim=2, flags="C_CONTIGUOUS"),
+                ctypes.c_int,
+                np.ctypeslib.ndpointer(dtype=dtype, ndim=3, flags="C_CONTIGUOUS"),
+            ]
+            func.restype = None
+        return lib
+    except (OSError, AttributeError) as e:
+        print(f" AVX2 filter kernel unavailable ({lib_path}): {e}")
+        return None
+
+
+_AVX2_LIB = _load_avx2_kernel()
+
+
+def _avx2_sosfilt_inplace(sos: np.ndarray, x: np.ndarray, zi: np.ndarray) -> None:
+    """
+    Run the AVX2 kernel over an (n_samples, 8) C-contiguous buffer in place.
+    sos, x and zi (n_sections, 2, 8) must share a float32 or float64 dtype.
+    """
+    func = _AVX2_LIB.biquad_sos_8ch_f32 if sos.dtype == np.float32 else _AVX2_LIB.biquad_sos_8ch_f64
+    func(np.ascontiguousarray(sos), sos.shape[0], x, x.shape[0], zi)
+
+
+def _use_avx2(x: np.ndarray) -> bool:
+    """True if the AVX2 kernel is loaded and x is an 8-lead (n_samples, 8) buffer."""
+    return _AVX2_LIB is not None and x.ndim == 2 and x.shape[1] == AVX2_CHANNELS
+
+
+# The JIT kernels run leads in parallel, and numba's workqueue threading layer
+# (used when TBB/OpenMP are not installed) aborts if parallel regions are
+# launched from several Python threads at once, so calls are serialised
+_JIT_KERNEL_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _compiled_kernels():
+    """
+    Resolve the compiled SOS kernels on first use (cached), so importing this
+    module does not pull in numba. Prefers the ahead-of-time compiled
+    ecg_kernels module (python build_ecg_kernels.py: no JIT warm-up, numba is
+    not imported), then the Numba JIT kernels (compiled on first call).
+    
+    Returns:
+        (sos_filter, sos_filtfilt) dicts keyed by np.dtype, or None if
+        neither is available
+    """
+    try:
+        from .ecg_kernels import sos_filter_f4, sos_filter_f8, sos_filtfilt_f4, sos_filtfilt_f8
+        return (
+            {np.dtype(np.float32): sos_filter_f4, np.dtype(np.float64): sos_filter_f8},
+            {np.dtype(np.float32): sos_filtfilt_f4, np.dtype(np.float64): sos_filtfilt_f8},
+        )
+    except ImportError:
+        pass
+    
+    try:
+        from .filter_kernels import sos_filter_nb, sos_filtfilt_nb
+    except ImportError:
+        return None
+    
+    def sos_filter_jit(sos, x, zi):
+        with _JIT_KERNEL_LOCK:
+            sos_filter_nb(sos, x, zi)
+    
+    def sos_filtfilt_jit(sos, x_ext, zi):
+        with _JIT_KERNEL_LOCK:
+            return sos_filtfilt_nb(sos, x_ext, zi)
+    
+    return (
+        {np.dtype(np.float32): sos_filter_jit, np.dtype(np.float64): sos_filter_jit},
+        {np.dtype(np.float32): sos_filtfilt_jit, np.dtype(np.float64): sos_filtfilt_jit},
+    )
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    """
+    Mark a cached coefficient array read-only so callers cannot corrupt the
+    cache. scipy's sosfilt/sosfiltfilt reject read-only coefficients, so they
+    are handed sos.copy().
+    """
+    arr.flags.writeable = False
+    return arr
+
+
+@functools.lru_cache(maxsize=32)
+def _design_notch(fs: float, f0: float, Q: float) -> np.ndarray:
+    """
+    Design (and cache) an IIR notch filter in second-order-sections form.
+    
+    Filter settings come from a small fixed set of UI options, so the
+    coefficients are designed once and reused on every streaming call.
+    
+    Args:
+        fs: Sampling frequency in Hz
+        f0: Notch frequency in Hz
+        Q: Quality factor
+    
+    Returns:
+        float32 SOS coefficient array of shape (n_sections, 6). Read-only (shared by the cache).
+    """
+    from scipy.signal import iirnotch, tf2sos
+    
+    b, a = iirnotch(f0 / (fs / 2.0), Q)
+    return _readonly(tf2sos(b, a).astype(FILTER_DTYPE))
+
+
+@functools.lru_cache(maxsize=32)
+def _design_butter(
+    order: int,
+    fs: float,
+    fc: Union[float, Tuple[float, float]],
+    btype: str,
+    dtype=FILTER_DTYPE
+) -> np.ndarray:
+    """
+    Design (and cache) a Butterworth filter in SOS form.
+    
+    Args:
+        order: Filter order
+        fs: Sampling frequency in Hz
+        fc: Cutoff frequency in Hz, or (low, high) tuple for band filters
+        btype: 'low', 'high' or 'bandstop'
+        dtype: Coefficient (and therefore arithmetic) precision
+    
+    Returns:
+        SOS coefficient array of shape (n_sections, 6). Read-only (shared by the cache).
+    """
+    from scipy.signal import butter
+    
+    wn = np.asarray(fc, dtype=float) / (fs / 2.0)
+    return _readonly(butter(order, wn, btype=btype, output='sos').astype(dtype))
+
+
+def _sosfilt(sos: np.ndarray, x: np.ndarray, zi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    sosfilt() along axis 0 with carried state. Uses the AVX2 kernel for
+    8-lead buffers and otherwise the compiled (AOT/Numba) kernel, which runs
+    leads in parallel; falls back to one SciPy call.
+    
+    Arithmetic runs in the coefficient dtype; the output is FILTER_DTYPE.
+    """
+    if _use_avx2(x):
+        y = np.array(x, dtype=sos.dtype, order="C")
+        zf = np.array(zi, dtype=sos.dtype, order="C")
+        _avx2_sosfilt_inplace(sos, y, zf)
+    elif x.ndim <= 2 and _compiled_kernels() is not None:
+        # Kernels take (n_samples, n_channels); a single lead is one column
+        sos_filter = _compiled_kernels()[0][sos.dtype]
+        y = np.array(x, dtype=sos.dtype, order="C")
+        zf = np.array(zi, dtype=sos.dtype, order="C")
+        if y.ndim == 1:
+            sos_filter(sos, y[:, None], zf[:, :, None])
+        else:
+            sos_filter(sos, y, zf)
+    else:
+        from scipy.signal import sosfilt
+        y, zf = sosfilt(sos.copy(), np.asarray(x, dtype=sos.dtype), axis=0, zi=zi.astype(sos.dtype, copy=False))
+    return y.astype(FILTER_DTYPE, copy=False), zf
+
+
+def _padlen(sos: np.ndarray, n_samples: int) -> int:
+    """
+    Edge padding for zero-phase filtering: scipy's sosfiltfilt default
+    (3 * ntaps), capped at a quarter of the buffer. Short display windows are
+    then still filtered instead of failing with "x must be longer than
+    padlen", and the padded copy stays small relative to the data.
+    """
+    ntaps = 2 * len(sos) + 1
+    ntaps -= min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum())
+    return int(min(3 * ntaps, n_samples // 4))
+
+
+def _sosfiltfilt(sos: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Zero-phase SOS filtering along axis 0 with odd-extension padding (see
+    _padlen), matching scipy's sosfiltfilt. Uses the AVX2 kernel for 8-lead
+    buffers and otherwise the compiled (AOT/Numba) kernel when available.
+    
+    Arithmetic runs in the coefficient dtype; the output is FILTER_DTYPE.
+    """
+    from scipy.signal import sosfilt_zi, sosfiltfilt
+    
+    x = np.asarray(x, dtype=sos.dtype)
+    padlen = _padlen(sos, len(x))
+    use_avx2 = _use_avx2(x)
+    if not (use_avx2 or (x.ndim <= 2 and _compiled_kernels() is not None)):
+        return sosfiltfilt(sos.copy(), x, axis=0, padlen=padlen).astype(FILTER_DTYPE, copy=False)
+    
+    # Odd extension about the end points (scipy padtype='odd')
+    left = 2 * x[0] - x[padlen:0:-1]
+    right = 2 * x[-1] - x[-2:-padlen - 2:-1]
+    x_ext = np.concatenate((left, x, right))
+    
+    zi = sosfilt_zi(sos).astype(sos.dtype)
+    if use_avx2:
+        # Forward pass, then backward pass on the time-reversed rows
+        zi = zi[:, :, None]
+        y = x_ext
+        _avx2_sosfilt_inplace(sos, y, zi * y[0])
+        y = np.ascontiguousarray(y[::-1])
+        _avx2_sosfilt_inplace(sos, y, zi * y[0])
+        y = y[::-1]
+    else:
+        y = _compiled_kernels()[1][x_ext.dtype](sos, x_ext.reshape(len(x_ext), -1), zi)
+        y = y.reshape(x_ext.shape)
+    return y[padlen:padlen + len(x)].astype(FILTER_DTYPE, copy=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cupy():
+    """
+    Import CuPy and its SciPy-compatible signal module on first use (cached).
+    Returns (cupy, cupyx.scipy.signal) or None if CuPy/CUDA is unavailable.
+    
+    CuPy imports fine without a GPU or CUDA driver, so a device is probed
+    here; otherwise the first transfer would raise a CUDA runtime error.
+    """
+    try:
+        import cupy
+        import cupyx.scipy.signal as cupy_signal
+        if cupy.cuda.runtime.getDeviceCount() < 1:
+            raise RuntimeError("no CUDA device found")
+        return cupy, cupy_signal
+    except Exception as e:
+        print(f" CuPy backend unavailable, filtering on CPU: {e}")
+        return None
+
+
+def _cupy_sosfiltfilt(sos: np.ndarray, x: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Zero-phase SOS filtering along axis 0 on the GPU. Returns None when CuPy
+    is unavailable so the caller can fall back to the CPU path.
+    """
+    modules = _load_cupy()
+    if modules is None:
+        return None
+    cupy, cupy_signal = modules
+    
+    x_gpu = cupy.asarray(x, dtype=sos.dtype)
+    y_gpu = cupy_signal.sosfiltfilt(cupy.asarray(sos), x_gpu, axis=0, padlen=_padlen(sos, x_gpu.shape[0]))
+    return cupy.asnumpy(y_gpu).astype(FILTER_DTYPE, copy=False)
+
+
+@functools.lru_cache(maxsize=32)
+def _impulse_length(sos_key: bytes) -> int:
+    """
+    Number of samples until the impulse response of an SOS filter (given as
+    float64 bytes) decays below 1e-7 of its peak (cached).
+    """
+    from scipy.signal import sosfilt
+    
+    sos = np.frombuffer(sos_key, dtype=np.float64).reshape(-1, 6).copy()
+    impulse = np.zeros(1 << 14)
+    impulse[0] = 1.0
+    h = np.abs(sosfilt(sos, impulse))
+    return int(np.nonzero(h > 1e-7 * h.max())[0][-1]) + 1
+
+
+@functools.lru_cache(maxsize=32)
+def _zero_phase_response(sos_key: bytes, nfft: int) -> np.ndarray:
+    """
+    |H(w)|^2 of an SOS filter (given as float64 bytes) on the rfft grid of
+    length nfft (cached). Multiplying a spectrum by it is equivalent to
+    forward-backward filtering.
+    """
+    from scipy import fft as sp_fft
+    from scipy.signal import sosfreqz
+    
+    sos = np.frombuffer(sos_key, dtype=np.float64).reshape(-1, 6).copy()
+    _, h = sosfreqz(sos, worN=2 * np.pi * sp_fft.rfftfreq(nfft))
+    return (np.abs(h) ** 2).astype(FILTER_DTYPE)
+
+
+def _fft_filtfilt(sos: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Zero-phase filtering along axis 0 in the frequency domain: one float32
+    rfft/irfft pair instead of two recursive passes.
+    
+    Only suitable for filters with a short impulse response (e.g. the EMG
+    low-pass), since the buffer is odd-extended by the impulse response
+    length and zero-padded by as much again to avoid circular wrap-around.
+    Buffers no longer than the impulse response are too short for that odd
+    extension and go through _sosfiltfilt instead.
+    """
+    from scipy import fft as sp_fft
+    
+    x = np.asarray(x, dtype=FILTER_DTYPE)
+    sos_key = np.asarray(sos, dtype=np.float64).tobytes()
+    n_taps = _impulse_length(sos_key)
+    if len(x) <= n_taps:
+        return _sosfiltfilt(sos, x)
+    
+    left = 2 * x[0] - x[n_taps:0:-1]
+    right = 2 * x[-1] - x[-2:-n_taps - 2:-1]
+    x_ext = np.concatenate((left, x, right))
+    
+    nfft = sp_fft.next_fast_len(len(x_ext) + n_taps, real=True)
+    gain = _zero_phase_response(sos_key, nfft)
+    if x_ext.ndim > 1:
+        gain = gain[:, None]
+    
+    y = sp_fft.irfft(sp_fft.rfft(x_ext, n=nfft, axis=0) * gain, n=nfft, axis=0)
+    return y[n_taps:n_taps + len(x)]
+
+
+def _parse_cutoff(setting: str, filter_name: str) -> float:
+    """Convert a filter setting string to Hz, raising ValueError with a clear message."""
+    try:
+        return float(setting)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {filter_name} filter setting: {setting!r}") from None
+
+
+def _parse_sampling_rate(sampling_rate: float) -> float:
+    """Convert a sampling rate to Hz, raising ValueError unless it is a finite number > 0."""
+    try:
+        fs = float(sampling_rate)
+    except (TypeError, ValueError):
+        fs = float("nan")
+    if not (np.isfinite(fs) and fs > 0):
+        raise ValueError(f"Invalid sampling rate: {sampling_rate!r}")
+    return fs
+
+
+def _ac_sos(sampling_rate: float, ac_filter: Optional[str]) -> Optional[np.ndarray]:
+    """Return the AC notch SOS for a setting, or None if the filter is off/invalid."""
+    if ac_filter == "off" or not ac_filter:
+        return None
+    
+    notch_freq = _parse_cutoff(ac_filter, "AC")  # 50 or 60 Hz
+    
+    # Normalize frequency
+    nyquist = sampling_rate / 2.0
+    w0 = notch_freq / nyquist
+    
+    # Ensure frequency is within valid range (0 < w0 < 1)
+    if w0 <= 0 or w0 >= 1:
+        print(f" AC filter frequency {notch_freq}Hz is invalid for sampling rate {sampling_rate}Hz")
+        return None
+    
+    # Quality factor for notch filter (reduced from 30 to avoid ringing)
+    quality_factor = 25.0
+    
+    # Design IIR notch filter (cached per sampling rate / frequency)
+    return _design_notch(float(sampling_rate), notch_freq, quality_factor)
+
+
+def _emg_sos(sampling_rate: float, emg_filter: Optional[str]) -> Optional[np.ndarray]:
+    """Return the EMG low-pass SOS for a setting, or None if the filter is off/invalid."""
+    if not emg_filter or emg_filter == "off":
+        return None
+    
+    cutoff_freq = _parse_cutoff(emg_filter, "EMG")
+    # Use 35-40 Hz range for EMG suppression (low-pass, not high-pass)
+    if cutoff_freq < 35:
+        cutoff_freq = 35.0
+    elif cutoff_freq > 40:
+        cutoff_freq = 40.0
+    
+    # Normalize cutoff frequency
+    nyquist = sampling_rate / 2.0
+    normalized_cutoff = cutoff_freq / nyquist
+    
+    # Ensure cutoff is within valid range
+    if normalized_cutoff <= 0 or normalized_cutoff >= 1:
+        print(f" EMG filter cutoff {cutoff_freq}Hz is invalid for sampling rate {sampling_rate}Hz")
+        return None
+    
+    # Design 4th order low-pass Butterworth filter (cached)
+    return _design_butter(4, float(sampling_rate), cutoff_freq, 'low')
+
+
+def _dft_sos(sampling_rate: float, dft_filter: Optional[str]) -> Optional[np.ndarray]:
+    """Return the DFT high-pass SOS for a setting, or None if the filter is off/invalid."""
+    if dft_filter == "off" or not dft_filter:
+        return None
+    
+    cutoff_freq = _parse_cutoff(dft_filter, "DFT")  # Low cutoff frequency (0.05 or 0.5 Hz)
+    
+    # Normalize cutoff frequency
+    nyquist = sampling_rate / 2.0
+    normalized_cutoff = cutoff_freq / nyquist
+    
+    # Ensure cutoff is within valid range
+    if normalized_cutoff <= 0 or normalized_cutoff >= 1:
+        print(f" DFT filter cutoff {cutoff_freq}Hz is invalid for sampling rate {sampling_rate}Hz")
+        return None
+    
+    # Design 2nd order high-pass Butterworth filter (gentle for baseline, cached).
+    # Kept in float64: at 0.05 Hz the poles sit within ~1e-3 of the unit circle
+    # and float32 arithmetic drifts by tens of ADC counts.
+    return _design_butter(2, float(sampling_rate), cutoff_freq, 'high', np.float64)
+
 
 def normalize_adc_signal(signal: np.ndarray, preserve_amplitude: bool = True) -> np.ndarray:
     """
@@ -84,6 +513,8 @@ def detect_qrs_regions(ecg: np.ndarray, fs: float = 500.0) -> np.ndarray:
         return np.zeros(len(ecg), dtype=bool)
     
     try:
+        from scipy.signal import find_peaks
+        
         # Find R-peaks (simple peak detection)
         # Use absolute value to handle inverted leads
         abs_ecg = np.abs(ecg)
@@ -157,47 +588,64 @@ def sharpen_qrs_gated(ecg: np.ndarray, fs: float = 500.0, alpha: float = 0.3) ->
         return ecg
 
 
+@functools.lru_cache(maxsize=32)
+def _chain_sos(
+    sampling_rate: float,
+    ac_filter: Optional[str],
+    emg_filter: Optional[str],
+    dft_filter: Optional[str]
+) -> Optional[np.ndarray]:
+    """
+    Build (and cache) the fused DFT -> EMG -> AC cascade for a settings tuple.
+    
+    All three stages are linear biquad cascades, so stacking their SOS rows
+    gives one filter with the same response as running them one after the
+    other. Disabled (or invalid) stages contribute no rows.
+    
+    Returns:
+        SOS array of shape (n_sections, 6), or None when every stage is off.
+        float64 whenever the DFT stage is enabled (see _dft_sos). Read-only
+        (shared by the cache).
+    
+    Raises:
+        ValueError: If sampling_rate or a filter setting is invalid
+    """
+    sampling_rate = _parse_sampling_rate(sampling_rate)
+    stages = (
+        _dft_sos(sampling_rate, dft_filter),
+        _emg_sos(sampling_rate, emg_filter),
+        _ac_sos(sampling_rate, ac_filter),
+    )
+    stages = [sos for sos in stages if sos is not None]
+    if not stages:
+        return None
+    return _readonly(np.vstack(stages))
+
+
 def apply_ac_filter(signal: np.ndarray, sampling_rate: float, ac_filter: str) -> np.ndarray:
     """
     Apply AC (Notch) Filter to remove power line interference
     
     Args:
-        signal: Input ECG signal
+        signal: Input ECG signal, 1-D or (n_samples, n_channels)
         sampling_rate: Sampling frequency in Hz
         ac_filter: "off", "50", or "60" (Hz)
     
     Returns:
         Filtered signal
+    
+    Raises:
+        ValueError: If ac_filter is not a number or sampling_rate is not positive
     """
-    if ac_filter == "off" or not ac_filter:
+    if ac_filter == "off" or not ac_filter or len(signal) == 0:
         return signal
     
-    try:
-        notch_freq = float(ac_filter)  # 50 or 60 Hz
-        
-        # Design notch filter (bandstop filter)
-        nyquist = sampling_rate / 2.0
-        quality_factor = 25.0  # Quality factor for notch filter (reduced from 30 to avoid ringing)
-        
-        # Normalize frequency
-        w0 = notch_freq / nyquist
-        
-        # Ensure frequency is within valid range (0 < w0 < 1)
-        if w0 <= 0 or w0 >= 1:
-            print(f" AC filter frequency {notch_freq}Hz is invalid for sampling rate {sampling_rate}Hz")
-            return signal
-        
-        # Design IIR notch filter
-        b, a = iirnotch(w0, quality_factor)
-        
-        # Apply filter (zero-phase filtering)
-        filtered_signal = filtfilt(b, a, signal)
-        
-        return filtered_signal
-    
-    except Exception as e:
-        print(f" Error applying AC filter ({ac_filter}Hz): {e}")
+    sos = _ac_sos(_parse_sampling_rate(sampling_rate), ac_filter)
+    if sos is None:
         return signal
+    
+    # Apply filter (zero-phase filtering)
+    return _sosfiltfilt(sos, signal)
 
 
 def apply_emg_filter(signal: np.ndarray, sampling_rate: float, emg_filter: str) -> np.ndarray:
@@ -206,46 +654,29 @@ def apply_emg_filter(signal: np.ndarray, sampling_rate: float, emg_filter: str)
     CORRECTED: Uses 35-40 Hz low-pass instead of high-pass to preserve QRS while removing EMG noise.
     
     Args:
-        signal: Input ECG signal
+        signal: Input ECG signal, 1-D or (n_samples, n_channels)
         sampling_rate: Sampling frequency in Hz
         emg_filter: Cutoff frequency - "25", "35", "40", "45", "75", "100", or "150" (Hz)
     
     Returns:
         Filtered signal
+    
+    Raises:
+        ValueError: If emg_filter is not a number or sampling_rate is not positive
     """
-    if not emg_filter or emg_filter == "off":
+    if not emg_filter or emg_filter == "off" or len(signal) == 0:
         return signal
     
-    try:
-        cutoff_freq = float(emg_filter)
-        # Use 35-40 Hz range for EMG suppression (low-pass, not high-pass)
-        if cutoff_freq < 35:
-            cutoff_freq = 35.0
-        elif cutoff_freq > 40:
-            cutoff_freq = 40.0
-        
-        # Design low-pass Butterworth filter
-        nyquist = sampling_rate / 2.0
-        
-        # Normalize cutoff frequency
-        normalized_cutoff = cutoff_freq / nyquist
-        
-        # Ensure cutoff is within valid range
-        if normalized_cutoff <= 0 or normalized_cutoff >= 1:
-            print(f" EMG filter cutoff {cutoff_freq}Hz is invalid for sampling rate {sampling_rate}Hz")
-            return signal
-        
-        # Design 4th order low-pass Butterworth filter (zero-phase)
-        b, a = butter(4, normalized_cutoff, btype='low')
-        
-        # Apply filter (zero-phase filtering)
-        filtered_signal = filtfilt(b, a, signal)
-        
-        return filtered_signal
-    
-    except Exception as e:
-        print(f" Error applying EMG filter ({emg_filter}Hz): {e}")
+    sos = _emg_sos(_parse_sampling_rate(sampling_rate), emg_filter)
+    if sos is None:
         return signal
+    
+    # Apply filter (zero-phase filtering). The EMG low-pass has a short
+    # impulse response, so single-lead buffers are filtered faster in the
+    # frequency domain; 8-lead buffers are faster on the SOS kernels.
+    if np.ndim(signal) == 1:
+        return _fft_filtfilt(sos, signal)
+    return _sosfiltfilt(sos, signal)
 
 
 def apply_dft_filter(signal: np.ndarray, sampling_rate: float, dft_filter: str) -> np.ndarray:
@@ -253,41 +684,25 @@ def apply_dft_filter(signal: np.ndarray, sampling_rate: float, dft_filter: str)
     Apply DFT Filter (High-pass filter) to remove baseline wander
     
     Args:
-        signal: Input ECG signal
+        signal: Input ECG signal, 1-D or (n_samples, n_channels)
         sampling_rate: Sampling frequency in Hz
         dft_filter: Cutoff frequency - "off", "0.05", or "0.5" (Hz)
     
     Returns:
         Filtered signal
+    
+    Raises:
+        ValueError: If dft_filter is not a number or sampling_rate is not positive
     """
-    if dft_filter == "off" or not dft_filter:
+    if dft_filter == "off" or not dft_filter or len(signal) == 0:
         return signal
     
-    try:
-        cutoff_freq = float(dft_filter)  # Low cutoff frequency (0.05 or 0.5 Hz)
-        
-        # Design high-pass Butterworth filter for baseline wander removal
-        nyquist = sampling_rate / 2.0
-        
-        # Normalize cutoff frequency
-        normalized_cutoff = cutoff_freq / nyquist
-        
-        # Ensure cutoff is within valid range
-        if normalized_cutoff <= 0 or normalized_cutoff >= 1:
-            print(f" DFT filter cutoff {cutoff_freq}Hz is invalid for sampling rate {sampling_rate}Hz")
-            return signal
-        
-        # Design 2nd order high-pass Butterworth filter (gentle for baseline)
-        b, a = butter(2, normalized_cutoff, btype='high')
-        
-        # Apply filter (zero-phase filtering)
-        filtered_signal = filtfilt(b, a, signal)
-        
-        return filtered_signal
-    
-    except Exception as e:
-        print(f" Error applying DFT filter ({dft_filter}Hz): {e}")
+    sos = _dft_sos(_parse_sampling_rate(sampling_rate), dft_filter)
+    if sos is None:
         return signal
+    
+    # Apply filter (zero-phase filtering)
+    return _sosfiltfilt(sos, signal)
 
 
 def process_ecg_monitor_grade(ecg: np.ndarray, fs: float = 500.0, apply_sharpening: bool = False) -> np.ndarray:
@@ -339,7 +754,9 @@ def apply_ecg_filters(
     sampling_rate: float = 500,
     ac_filter: Optional[str] = None,
     emg_filter: Optional[str] = None,
-    dft_filter: Optional[str] = None
+    dft_filter: Optional[str] = None,
+    state: Optional["ECGFilterChain"] = None,
+    backend: str = "cpu"
 ) -> np.ndarray:
     """
     Apply all ECG filters in the correct order:
@@ -347,40 +764,175 @@ def apply_ecg_filters(
     2. EMG Filter (muscle artifact removal)
     3. AC Filter (power line interference removal) - last
     
+    The enabled stages are fused into a single zero-phase SOS cascade.
+    
+    Multi-lead input of shape (n_samples, n_channels) is filtered along
+    axis 0 in a single pass, e.g. np.stack([I, II, V1, V2, ...], axis=1),
+    instead of calling this once per lead.
+    
     Args:
-        signal: Input ECG signal (numpy array or list)
+        signal: Input ECG signal (numpy array or list), 1-D or (n_samples, n_channels)
         sampling_rate: Sampling frequency in Hz (default: 500)
         ac_filter: AC filter setting - "off", "50", or "60"
         emg_filter: EMG filter setting - "25", "35", "45", "75", "100", "150"
         dft_filter: DFT filter setting - "off", "0.05", or "0.5"
+        state: Optional ECGFilterChain for real-time streaming. When given, the
+            signal is treated as the next chunk of a stream and filtered causally
+            with filter state carried over from the previous chunk (zero-phase
+            filtering of the whole buffer is skipped).
+        backend: "cpu" (default) or "cupy" to run the zero-phase filter on a
+            CUDA GPU via CuPy - worthwhile for long multi-lead retrospective
+            recordings. Falls back to the CPU if CuPy is not installed.
     
     Returns:
         Filtered signal as numpy array
+    
+    Raises:
+        ValueError: If a filter setting is not a number, sampling_rate is not
+            positive, or backend is unknown
     """
-    # Convert to numpy array if needed
-    if not isinstance(signal, np.ndarray):
-        signal = np.array(signal, dtype=float)
+    if backend not in ("cpu", "cupy"):
+        raise ValueError(f"Unknown filter backend '{backend}' (expected 'cpu' or 'cupy')")
     
-    # Check minimum signal length
-    if len(signal) < 10:
-        return signal
+    if state is not None:
+        state.configure(sampling_rate, ac_filter, emg_filter, dft_filter)
+        return state.process(signal)
+    
+    # Fast path: nothing to do when every filter is off (common default),
+    # so skip conversion/allocation and hand the signal straight back
+    if not any(f and f != "off" for f in (dft_filter, emg_filter, ac_filter)):
+        return signal if isinstance(signal, np.ndarray) else np.asarray(signal, dtype=FILTER_DTYPE)
+    
+    # All enabled stages run as one fused SOS cascade, so the buffer is padded
+    # and filtered once instead of once per stage. The fused filter returns a
+    # new array and never modifies its input (no defensive copy needed).
+    sos = _chain_sos(_parse_sampling_rate(sampling_rate), ac_filter, emg_filter, dft_filter)
     
-    # Apply filters in correct order
-    filtered = signal.copy()
+    # Convert once, straight to the dtype the cascade runs in (float64 while
+    # the DFT stage is on, see _dft_sos). No copy when the caller's buffer
+    # already matches; the output is FILTER_DTYPE either way.
+    signal = np.ascontiguousarray(signal, dtype=FILTER_DTYPE if sos is None else sos.dtype)
     
-    # 1. DFT Filter first (removes slow baseline wander)
-    if dft_filter:
-        filtered = apply_dft_filter(filtered, sampling_rate, dft_filter)
+    # Check minimum signal length
+    if sos is None or len(signal) < 10:
+        return signal.astype(FILTER_DTYPE, copy=False)
     
-    # 2. EMG Filter second (removes muscle artifacts)
-    if emg_filter:
-        filtered = apply_emg_filter(filtered, sampling_rate, emg_filter)
+    if backend == "cupy":
+        filtered = _cupy_sosfiltfilt(sos, signal)
+        if filtered is not None:
+            return filtered
     
-    # 3. AC Filter last (removes power line interference)
-    if ac_filter:
-        filtered = apply_ac_filter(filtered, sampling_rate, ac_filter)
+    return _sosfiltfilt(sos, signal)
+
+
+class ECGFilterChain:
+    """
+    Stateful DFT -> EMG -> AC filter chain for real-time streaming.
+    Accepts a single lead or all leads at once as (n_samples, n_channels).
+    
+    apply_ecg_filters() runs zero-phase sosfiltfilt over the whole buffer on
+    every call (two passes plus padding, no memory between calls). For a live
+    stream, this chain instead filters each new chunk once with sosfilt and
+    carries the per-section filter state (zi) over to the next chunk, so there
+    are no edge artifacts at chunk boundaries.
+    
+    Usage:
+        chain = ECGFilterChain(sampling_rate=500, ac_filter="50", emg_filter="150", dft_filter="0.5")
+        for chunk in stream:
+            filtered_chunk = chain.process(chunk)
+    """
     
-    return filtered
+    def __init__(
+        self,
+        sampling_rate: float = 500,
+        ac_filter: Optional[str] = None,
+        emg_filter: Optional[str] = None,
+        dft_filter: Optional[str] = None
+    ):
+        self._settings = None
+        self.sos = None
+        self.zi = None
+        self.configure(sampling_rate, ac_filter, emg_filter, dft_filter)
+    
+    def configure(
+        self,
+        sampling_rate: float,
+        ac_filter: Optional[str] = None,
+        emg_filter: Optional[str] = None,
+        dft_filter: Optional[str] = None
+    ) -> None:
+        """
+        Update filter settings. Coefficients are only redesigned (and the
+        stream state reset) when the settings actually change, so this is
+        cheap to call for every chunk.
+        """
+        settings = (_parse_sampling_rate(sampling_rate), ac_filter, emg_filter, dft_filter)
+        if settings != self._settings:
+            self.rebuild(sampling_rate, ac_filter, emg_filter, dft_filter)
+    
+    def rebuild(
+        self,
+        sampling_rate: float,
+        ac_filter: Optional[str] = None,
+        emg_filter: Optional[str] = None,
+        dft_filter: Optional[str] = None
+    ) -> None:
+        """
+        Redesign the chain for new settings (call on a settings change, not
+        per buffer) and reset the stream state.
+        
+        The enabled DFT -> EMG -> AC stages are stacked into one SOS matrix
+        (see _chain_sos), so each chunk runs through a single cascade.
+        """
+        self.sampling_rate = _parse_sampling_rate(sampling_rate)
+        self._settings = (self.sampling_rate, ac_filter, emg_filter, dft_filter)
+        self.sos = _chain_sos(self.sampling_rate, ac_filter, emg_filter, dft_filter)
+        # Steady-state step response per section, shape (n_sections, 2)
+        from scipy.signal import sosfilt_zi
+        self._zi_step = None if self.sos is None else sosfilt_zi(self.sos).astype(self.sos.dtype)
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget the stream state (e.g. after a lead-off or acquisition restart)."""
+        self.zi = None
+    
+    def process(self, chunk: Union[np.ndarray, list]) -> np.ndarray:
+        """
+        Causally filter the next chunk of the stream.
+        
+        Args:
+            chunk: New samples (numpy array or list), 1-D or (n_samples, n_channels)
+        
+        Returns:
+            Filtered samples, same shape as chunk
+        """
+        filtered = np.asarray(chunk, dtype=FILTER_DTYPE)
+        if len(filtered) == 0 or self.sos is None:
+            return filtered
+        
+        if self.zi is None or self.zi.shape[2:] != filtered.shape[1:]:
+            # Start in steady state at the first sample to avoid a start-up transient.
+            # State is (n_sections, 2) per lead -> (n_sections, 2, n_channels) for multi-lead input.
+            zi = self._zi_step.reshape(self.sos.shape[0], 2, *([1] * (filtered.ndim - 1)))
+            self.zi = zi * filtered[0]
+        filtered, self.zi = _sosfilt(self.sos, filtered, self.zi)
+        return filtered
+    
+    def filtfilt(self, signal: Union[np.ndarray, list]) -> np.ndarray:
+        """
+        Zero-phase filter a complete (offline) buffer with the fused cascade.
+        Does not touch the stream state.
+        
+        Args:
+            signal: Full ECG buffer, 1-D or (n_samples, n_channels)
+        
+        Returns:
+            Filtered signal
+        """
+        filtered = np.asarray(signal, dtype=FILTER_DTYPE)
+        if len(filtered) == 0 or self.sos is None:
+            return filtered
+        return _sosfiltfilt(self.sos, filtered)
 
 
 def apply_baseline_wander_median_mean(signal: np.ndarray, sampling_rate: float = 500) -> np.ndarray:
@@ -413,6 +965,9 @@ def apply_baseline_wander_median_mean(signal: np.ndarray, sampling_rate: float =
         return signal - np.mean(signal)
     
     try:
+        from scipy.ndimage import uniform_filter1d
+        from scipy.signal import medfilt
+        
         # Step 1: Median filter (120 ms window - reduced from 200 ms to avoid QRS erosion)
         median_window_ms = 120.0  # milliseconds
         median_window = int(median_window_ms * sampling_rate / 1000.0)
@@ -462,12 +1017,14 @@ def notch_filter_butterworth(ecg: np.ndarray, fs: float, freq: float = 50.0, q:
         return ecg
     
     try:
+        from scipy.signal import sosfiltfilt
+        
         w0 = freq / (fs / 2.0)
         if w0 <= 0 or w0 >= 1:
             return ecg
         
-        b, a = butter(2, [w0 - w0/q, w0 + w0/q], btype='bandstop')
-        return filtfilt(b, a, ecg)
+        sos = _design_butter(2, float(fs), (freq - freq / q, freq + freq / q), 'bandstop', np.float64)
+        return sosfiltfilt(sos.copy(), ecg, padlen=_padlen(sos, len(ecg)))
     except Exception as e:
         print(f" Error applying notch filter: {e}")
         return ecg
@@ -493,6 +1050,8 @@ def estimate_baseline_drift(ecg: np.ndarray, fs: float) -> np.ndarray:
         return np.zeros_like(ecg)
     
     try:
+        from scipy.signal import medfilt
+        
         # Median filter removes QRS influence (120 ms window - reduced from 200 ms to avoid QRS erosion)
         median_window = int(0.12 * fs) | 1  # Ensure odd
         if median_window < 3:
@@ -537,6 +1096,8 @@ def extract_respiration(drift_signal: np.ndarray, fs: float) -> np.ndarray:
         return np.zeros_like(drift_signal)
     
     try:
+        from scipy.signal import sosfiltfilt
+        
         # Low-pass filter at 0.35 Hz to extract respiration from drift signal
         nyquist = fs / 2.0
         cutoff = 0.35 / nyquist
@@ -544,8 +1105,8 @@ def extract_respiration(drift_signal: np.ndarray, fs: float) -> np.ndarray:
         if cutoff <= 0 or cutoff >= 1:
             return np.zeros_like(drift_signal)
         
-        b, a = butter(2, cutoff, btype='low')
-        resp = filtfilt(b, a, drift_signal)
+        sos = _design_butter(2, float(fs), 0.35, 'low', np.float64)
+        resp = sosfiltfilt(sos.copy(), drift_signal, padlen=_padlen(sos, len(drift_signal)))
         
         # Remove DC offset
         resp = resp - np.mean(resp)
@@ -0,0 +1,81 @@
+"""
+Compiled IIR (SOS biquad cascade) kernels used by ecg_filters.
+
+Requires numba. The kernels are JIT-compiled on first use (and cached to
+__pycache__); build_ecg_kernels.py also compiles them ahead of time into the
+ecg_kernels extension module, which ecg_filters prefers when present so that
+short-lived processes skip JIT warm-up entirely.
+
+Signals are (n_samples, n_channels). Leads are independent, so the JIT
+kernels run one lead per thread (prange) and release the GIL, letting
+acquisition / UI threads keep running Python code while a buffer is
+filtered. The parallel kernels are not reentrant under numba's workqueue
+threading layer, so concurrent callers must serialise calls (ecg_filters
+holds a lock around them). The AOT build has no threading layer and runs
+the same loop serially.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(nogil=True, fastmath=True, cache=True)
+def _sos_filter_lead(sos, lead, z):
+    """Biquad cascade over one contiguous lead in place; z is (n_sections, 2)."""
+    n_sections = sos.shape[0]
+    for n in range(lead.shape[0]):
+        xn = lead[n]
+        for s in range(n_sections):
+            yn = sos[s, 0] * xn + z[s, 0]
+            z[s, 0] = sos[s, 1] * xn - sos[s, 4] * yn + z[s, 1]
+            z[s, 1] = sos[s, 2] * xn - sos[s, 5] * yn
+            xn = yn
+        lead[n] = xn
+
+
+@njit(nogil=True, parallel=True, fastmath=True, cache=True)
+def sos_filter_nb(sos, x, zi):
+    """
+    Run a biquad (SOS) cascade over x in place (transposed direct form II,
+    same state convention as scipy.signal.sosfilt / sosfilt_zi).
+
+    Args:
+        sos: SOS coefficients, shape (n_sections, 6), a0 == 1
+        x: Signal (n_samples, n_channels), same dtype as sos, overwritten
+            with the filtered output
+        zi: Filter state, shape (n_sections, 2, n_channels), updated in place
+    """
+    for c in prange(x.shape[1]):
+        # Work on contiguous copies so threads do not share cache lines of
+        # the interleaved (n_samples, n_channels) buffer
+        lead = x[:, c].copy()
+        z = zi[:, :, c].copy()
+        _sos_filter_lead(sos, lead, z)
+        x[:, c] = lead
+        zi[:, :, c] = z
+
+
+@njit(nogil=True, parallel=True, fastmath=True, cache=True)
+def sos_filtfilt_nb(sos, x_ext, zi):
+    """
+    Forward-backward (zero-phase) SOS filtering of an already padded signal,
+    matching scipy.signal.sosfiltfilt.
+
+    Args:
+        sos: SOS coefficients, shape (n_sections, 6)
+        x_ext: Signal (n_samples, n_channels), same dtype as sos, with
+            odd-extension padding on both ends
+        zi: Steady-state step response from sosfilt_zi, shape (n_sections, 2)
+
+    Returns:
+        Filtered (still padded) signal
+    """
+    y = np.empty_like(x_ext)
+    for c in prange(x_ext.shape[1]):
+        lead = x_ext[:, c].copy()
+        _sos_filter_lead(sos, lead, zi * lead[0])
+
+        lead = lead[::-1].copy()
+        _sos_filter_lead(sos, lead, zi * lead[0])
+        y[:, c] = lead[::-1]
+    return y
@@ -0,0 +1,113 @@
+/*
+ * AVX2 biquad (SOS) cascade for 8 ECG leads at once.
+ *
+ * The IIR recurrence is serial along time, but the 8 leads are independent,
+ * so each time step processes all leads in one vector: 8 float32 lanes in a
+ * __m256, or 2 x 4 float64 lanes in a pair of __m256d.
+ *
+ * Layout (all C-contiguous, filtered in place):
+ *   sos: (n_sections, 6)  [b0, b1, b2, a0, a1, a2], a0 == 1
+ *   x:   (n_samples, 8)   one row per time step, one column per lead
+ *   zi:  (n_sections, 2, 8)
+ *
+ * Transposed direct form II, same state convention as scipy.signal.sosfilt
+ * and sosfilt_zi, so state can be handed back and forth with SciPy.
+ *
+ * The kernels are compiled for AVX2/FMA via function target attributes, so
+ * the library itself loads on any x86-64 CPU; call biquad_cpu_has_avx2()
+ * before using them.
+ *
+ * Build: python build_ecg_kernels.py
+ */
+
+#include <immintrin.h>
+
+#if defined(_MSC_VER)
+#include <intrin.h>
+#define EXPORT __declspec(dllexport)
+#define TARGET_AVX2
+#else
+#define EXPORT __attribute__((visibility("default")))
+#define TARGET_AVX2 __attribute__((target("avx2,fma")))
+#endif
+
+#define N_CHANNELS 8
+
+EXPORT int biquad_cpu_has_avx2(void)
+{
+#if defined(_MSC_VER)
+    int info[4];
+    __cpuid(info, 0);
+    if (info[0] < 7)
+        return 0;
+    __cpuid(info, 1);
+    int has_fma = (info[2] >> 12) & 1;
+    int has_osxsave = (info[2] >> 27) & 1;
+    if (!has_fma || !has_osxsave || (_xgetbv(0) & 0x6) != 0x6)
+        return 0;
+    __cpuidex(info, 7, 0);
+    return (info[1] >> 5) & 1;
+#else
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma");
+#endif
+}
+
+TARGET_AVX2
+EXPORT void biquad_sos_8ch_f32(const float *sos, int n_sections, float *x, int n_samples, float *zi)
+{
+    for (int n = 0; n < n_samples; n++) {
+        __m256 xn = _mm256_loadu_ps(x + (long long)n * N_CHANNELS);
+        for (int s = 0; s < n_sections; s++) {
+            const float *c = sos + s * 6;
+            float *z = zi + s * 2 * N_CHANNELS;
+            __m256 z0 = _mm256_loadu_ps(z);
+            __m256 z1 = _mm256_loadu_ps(z + N_CHANNELS);
+
+            /* y = b0*x + z0; z0 = b1*x - a1*y + z1; z1 = b2*x - a2*y */
+            __m256 yn = _mm256_fmadd_ps(_mm256_set1_ps(c[0]), xn, z0);
+            z0 = _mm256_fnmadd_ps(_mm256_set1_ps(c[4]), yn, _mm256_fmadd_ps(_mm256_set1_ps(c[1]), xn, z1));
+            z1 = _mm256_fnmadd_ps(_mm256_set1_ps(c[5]), yn, _mm256_mul_ps(_mm256_set1_ps(c[2]), xn));
+
+            _mm256_storeu_ps(z, z0);
+            _mm256_storeu_ps(z + N_CHANNELS, z1);
+            xn = yn;
+        }
+        _mm256_storeu_ps(x + (long long)n * N_CHANNELS, xn);
+    }
+}
+
+TARGET_AVX2
+EXPORT void biquad_sos_8ch_f64(const double *sos, int n_sections, double *x, int n_samples, double *zi)
+{
+    for (int n = 0; n < n_samples; n++) {
+        double *row = x + (long long)n * N_CHANNELS;
+        __m256d xlo = _mm256_loadu_pd(row);
+        __m256d xhi = _mm256_loadu_pd(row + 4);
+        for (int s = 0; s < n_sections; s++) {
+            const double *c = sos + s * 6;
+            double *z = zi + s * 2 * N_CHANNELS;
+            __m256d b0 = _mm256_set1_pd(c[0]);
+            __m256d b1 = _mm256_set1_pd(c[1]);
+            __m256d b2 = _mm256_set1_pd(c[2]);
+            __m256d a1 = _mm256_set1_pd(c[4]);
+            __m256d a2 = _mm256_set1_pd(c[5]);
+
+            __m256d ylo = _mm256_fmadd_pd(b0, xlo, _mm256_loadu_pd(z));
+            __m256d yhi = _mm256_fmadd_pd(b0, xhi, _mm256_loadu_pd(z + 4));
+            __m256d z0lo = _mm256_fnmadd_pd(a1, ylo, _mm256_fmadd_pd(b1, xlo, _mm256_loadu_pd(z + 8)));
+            __m256d z0hi = _mm256_fnmadd_pd(a1, yhi, _mm256_fmadd_pd(b1, xhi, _mm256_loadu_pd(z + 12)));
+            __m256d z1lo = _mm256_fnmadd_pd(a2, ylo, _mm256_mul_pd(b2, xlo));
+            __m256d z1hi = _mm256_fnmadd_pd(a2, yhi, _mm256_mul_pd(b2, xhi));
+
+            _mm256_storeu_pd(z, z0lo);
+            _mm256_storeu_pd(z + 4, z0hi);
+            _mm256_storeu_pd(z + 8, z1lo);
+            _mm256_storeu_pd(z + 12, z1hi);
+            xlo = ylo;
+            xhi = yhi;
+        }
+        _mm256_storeu_pd(row, xlo);
+        _mm256_storeu_pd(row + 4, xhi);
+    }
+}